@@ -1,12 +1,92 @@
+import decimal
+import functools
+import gzip
+import itertools
 import json
+import math
+import operator
+import os
+import queue
+import re
+import sys
+import threading
+import weakref
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from sqlalchemy.engine import default
 from sqlalchemy import types as sqltypes
 from sqlalchemy.sql.expression import text
 from sqlalchemy.engine.reflection import cache
+
+try:
+    from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+except ImportError:
+    # SQLAlchemy 1.4 has no multi-table reflection, the get_multi_* hooks go unused
+    ObjectKind = ObjectScope = None
 from sqlglot import parse_one, exp
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, allow_nan=False).encode()
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import importlib.metadata as _metadata
+    _PACKAGE_VERSION = _metadata.version("duckdb_http")
+except Exception:
+    _PACKAGE_VERSION = None
+
+# bump when the shape or the type mapping of cached reflection results changes
+_REFLECTION_CACHE_FORMAT = 2
+
+_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+# statements starting with one of these keywords are read-only on their own; PRAGMA
+# is left to the parser, which rejects it (sqlglot parses it to exp.Pragma)
+_READ_ONLY_KEYWORDS = {"SELECT", "SHOW", "EXPLAIN"}
+_KEYWORD_RE = re.compile(r"[A-Za-z]+")
+# longer statements are parsed but not kept in the cache
+_MAX_CACHED_SQL = 64 * 1024
+
 def is_read_only(sql: str) -> bool:
+    sql = sql.strip()
+
+    # fast path: a single statement led by a read-only keyword needs no parse
+    m = _KEYWORD_RE.match(sql)
+    if m and m.group(0).upper() in _READ_ONLY_KEYWORDS and ";" not in sql.rstrip(";"):
+        return True
+
+    if len(sql) > _MAX_CACHED_SQL:
+        return _parse_read_only.__wrapped__(sql)
+    return _parse_read_only(sql)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_read_only(sql: str) -> bool:
     tree = parse_one(sql, error_level="ignore")
     if tree is None:
         return False
@@ -23,6 +103,123 @@ def is_read_only(sql: str) -> bool:
 
     return False
 
+# keep-alive sockets per session
+_POOL_MAXSIZE = 16
+
+# (connect, read) timeout in seconds; the read part can be raised with ?timeout=
+_DEFAULT_TIMEOUT = (3, 60)
+
+def _new_session():
+    session = requests.Session()
+    # POSTs are only retried on connection errors, never once sent
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_MAXSIZE,
+                          max_retries=Retry(total=3, backoff_factor=0.1))
+    session.mount("http://", adapter)
+    return session
+
+# sessions per (server url, pool_size), shared by every Connection to it so warm
+# keep-alive sockets outlive the connections that opened them. At most pool_size
+# are out at once; a free slot holds None until its session is first needed.
+_SESSION_POOL = {}
+_SESSION_POOL_LOCK = threading.Lock()
+_DEFAULT_POOL_SIZE = 16
+# seconds a new Connection waits for a session before giving up
+_POOL_TIMEOUT = 30
+
+def _checkout_session(key):
+    with _SESSION_POOL_LOCK:
+        pool = _SESSION_POOL.get(key)
+        if pool is None:
+            pool = _SESSION_POOL[key] = queue.LifoQueue(maxsize=key[1])
+            for _ in range(key[1]):
+                pool.put_nowait(None)
+    try:
+        session = pool.get(timeout=_POOL_TIMEOUT)
+    except queue.Empty:
+        # the url may carry credentials, keep it out of the message
+        raise DuckDBHTTPDBAPI.Error(f"No free session after {_POOL_TIMEOUT}s (pool_size={key[1]})") from None
+    return session if session is not None else _new_session()
+
+def _checkin_session(key, session, pid):
+    # sessions from before a fork share sockets with the parent, never pool them
+    pool = _SESSION_POOL.get(key) if pid == os.getpid() else None
+    try:
+        if pool is None:
+            raise queue.Full
+        pool.put_nowait(session)
+    except queue.Full:
+        session.close()
+
+def _reset_session_pool():
+    global _SESSION_POOL_LOCK
+    _SESSION_POOL.clear()
+    _SESSION_POOL_LOCK = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_session_pool)
+
+# request bodies up to this size are not worth compressing
+_MIN_COMPRESS_SIZE = 1024
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return gzip.compress(body, compresslevel=6)
+
+# pyformat placeholders ("%(name)s", "%s") and escaped percents in compiled SQL
+_PYFORMAT_RE = re.compile(r"%\((\w+)\)s|%s|%%")
+
+# servers (by url) that turned down a parameterized query that then ran inlined
+_NO_SERVER_BINDING = set()
+
+def _render_number(value):
+    # a leading space keeps "5 -%s" with -1 from turning into the comment "5 --1"
+    text = repr(value) if isinstance(value, float) else str(value)
+    return f" {text}" if text.startswith("-") else text
+
+def _render_literal(value, name=None):
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return _render_number(value)
+    if isinstance(value, float):
+        return _render_number(value) if math.isfinite(value) else f"'{value}'::DOUBLE"
+    if isinstance(value, decimal.Decimal):
+        return _render_number(value) if value.is_finite() else f"'{value}'::DOUBLE"
+    if isinstance(value, (bytes, bytearray)):
+        return "'" + "".join(f"\\x{b:02x}" for b in value) + "'::BLOB"
+    return "'" + str(value).replace("'", "''") + "'"
+
+def _is_json_value(value):
+    # values JSON carries exactly; bytes, Decimal, dates, NaN/inf, ints beyond
+    # 64 bits (HUGEINT, and orjson's limit) etc. are inlined instead
+    if value is None or isinstance(value, (bool, str)):
+        return True
+    if isinstance(value, int):
+        return -2**63 <= value < 2**64
+    return isinstance(value, float) and math.isfinite(value)
+
+def _can_bind(parameters):
+    values = parameters.values() if isinstance(parameters, dict) else parameters
+    return all(map(_is_json_value, values))
+
+def _render_placeholder(value, name=None):
+    return f"${name}" if name is not None else "?"
+
+def _substitute(query, parameters, render):
+    positional = iter(parameters) if isinstance(parameters, (list, tuple)) else None
+
+    def replace(m):
+        if m.group(0) == "%%":
+            return "%"
+        if m.group(1) is not None:
+            return render(parameters[m.group(1)], m.group(1))
+        return render(next(positional))
+
+    return _PYFORMAT_RE.sub(replace, query)
+
 # --- DBAPI stub ---
 class DuckDBHTTPDBAPI:
     paramstyle = "pyformat"
@@ -31,16 +228,34 @@ class DuckDBHTTPDBAPI:
         pass
 
     class Connection:
-        def __init__(self, url, api_key=None, read_only=False):
+        def __init__(self, url, api_key=None, read_only=False, timeout=None, compression=None,
+                     pool_size=_DEFAULT_POOL_SIZE):
+            if compression not in (None, "gzip", "zstd"):
+                raise DuckDBHTTPDBAPI.Error(f"Unsupported compression: {compression}")
+            if compression == "zstd" and zstandard is None:
+                raise DuckDBHTTPDBAPI.Error("compression=zstd requires zstandard")
+            if pool_size < 1:
+                raise DuckDBHTTPDBAPI.Error(f"pool_size must be at least 1, got {pool_size}")
             self.url = url
             self.api_key = api_key
             self.read_only = read_only
+            self.timeout = (_DEFAULT_TIMEOUT[0], timeout) if timeout else _DEFAULT_TIMEOUT
+            self.compression = compression
+            # keep-alive session borrowed from the pool, shared by this connection's cursors;
+            # it goes back when the connection is closed or garbage-collected (cursors keep
+            # the connection alive)
+            key = (url, pool_size)
+            self._session = _checkout_session(key)
+            self._release = weakref.finalize(self, _checkin_session, key, self._session, os.getpid())
 
         def cursor(self):
-            return DuckDBHTTPDBAPI.Cursor(self.url, self.api_key, self.read_only)
+            return DuckDBHTTPDBAPI.Cursor(self.url, self.api_key, self.read_only,
+                                          timeout=self.timeout, compression=self.compression,
+                                          connection=self)
 
         def close(self):
-            pass
+            self._release()
+            self._session = None
 
         def commit(self):
             pass
@@ -49,83 +264,214 @@ class DuckDBHTTPDBAPI:
             pass
 
     class Cursor:
-        def __init__(self, url, api_key=None, read_only=False):
+        def __init__(self, url, api_key=None, read_only=False, session=None, timeout=_DEFAULT_TIMEOUT,
+                     compression=None, connection=None):
             self.url = url
             self.api_key = api_key
             self.read_only = read_only
-            self._results = []
+            self.timeout = timeout
+            self.compression = compression
+            # cursors of a Connection use its session; the requests module itself stands
+            # in for one when used standalone
+            self.connection = connection
+            self._session = session if session is not None else requests
+            self._results = []     # row tuples; None until an Arrow table is converted
+            self._table = None     # pyarrow.Table when the server answered in Arrow
             self._row_idx = 0
-            self.description = []
+            self._set_columns([])
             self.rowcount = 0
 
+        # description is only built when somebody reads it. SQLAlchemy reads it after
+        # every execute, so this only saves work for plain DB-API callers
+        def _set_columns(self, cols, types=None):
+            self._cols, self._types = cols, types
+            self._description = None
+
+        @property
+        def description(self):
+            if self._description is None:
+                types = self._types if self._types is not None else itertools.repeat(None)
+                self._description = [(c, t, None, None, None, None, None) for c, t in zip(self._cols, types)]
+            return self._description
+
         def execute(self, query, parameters=None):
-            if parameters:
-                query = query % parameters
+            # values are inlined as escaped SQL literals unless the server binds them
+            inline = _substitute(query, parameters, _render_literal) if parameters is not None else query
 
             # support read-only
-            if self.read_only and not is_read_only(query):
-                raise PermissionError(f"Blocked non-read query: {query}")
+            if self.read_only and not is_read_only(inline):
+                raise PermissionError(f"Blocked non-read query: {inline}")
+
+            bind = bool(parameters) and self.url not in _NO_SERVER_BINDING and _can_bind(parameters)
+            if bind:
+                # fixed statement text, values bound by the server
+                sql = _substitute(query, parameters, _render_placeholder)
+                body = _json_dumps({"sql": sql, "params": parameters})
+                with self._post(body, "application/json") as resp:
+                    if resp.status_code not in (400, 415):
+                        self._process_response(resp)
+                        return self
+
+            with self._post(inline.encode()) as resp:
+                self._process_response(resp)
+            if bind:
+                # only the bound form failed, stop trying it on this server
+                _NO_SERVER_BINDING.add(self.url)
+            return self
 
+        def _post(self, body, content_type=None):
             headers = {}
             if self.api_key:
                 headers["X-API-Key"] = self.api_key            
-
-            resp = requests.post(self.url, data=query, headers=headers)
-            resp.raise_for_status()
-            
-            # line-delimited JSON
-            lines = resp.text.splitlines()
-            payloads = [json.loads(line) for line in lines if line]
-
-            self._process_payloads(payloads)
-            return self
+            if content_type:
+                headers["Content-Type"] = content_type
+            if pyarrow is not None:
+                headers["Accept"] = f"{_ARROW_STREAM}, */*;q=0.9"
+
+            if self.compression and len(body) > _MIN_COMPRESS_SIZE:
+                body = _compress(body, self.compression)
+                headers["Content-Encoding"] = self.compression
+
+            session = self._session
+            if self.connection is not None:
+                # the session is back in the pool once the connection is closed
+                session = self.connection._session
+                if session is None:
+                    raise DuckDBHTTPDBAPI.Error("Connection is closed")
+            return session.post(self.url, data=body, headers=headers,
+                                timeout=self.timeout, stream=True)
+
+        def _process_response(self, resp):
+            if resp.status_code >= 400:
+                # surface DuckDB's own error message
+                raise DuckDBHTTPDBAPI.Error(f"HTTP {resp.status_code}: {resp.text[:1024]}")
+            if resp.headers.get("Content-Type", "").startswith(_ARROW_STREAM):
+                resp.raw.decode_content = True
+                self._process_arrow(pyarrow.ipc.open_stream(resp.raw).read_all())
+            else:
+                self._process_payloads(self._iter_payloads(resp))
+
+        @staticmethod
+        def _iter_payloads(resp):
+            content_type = resp.headers.get("Content-Type", "")
+            if content_type.startswith("application/json"):
+                # JSON array: parse the rows straight off the socket
+                resp.raw.decode_content = True
+                events = ijson.parse(resp.raw, use_float=True)
+                first = next(events, None)
+                if first is None or first[1] != "start_array":
+                    kind = first[1] if first else "nothing"
+                    raise DuckDBHTTPDBAPI.Error(f"Expected a JSON array of rows, got {kind}")
+                return ijson.items(itertools.chain((first,), events), "item")
+
+            # line-delimited JSON, decoded straight from the raw byte lines
+            lines = resp.iter_lines(chunk_size=65536, decode_unicode=False)
+            return map(_json_loads, filter(None, lines))
+
+        def _process_arrow(self, table):
+            # the columnar table is only turned into row tuples when rows are fetched
+            self._table, self._results = table, None
+            self._set_columns(table.column_names, table.schema.types)
+            self.rowcount = table.num_rows
+            self._row_idx = 0
 
         def _process_payloads(self, payloads):
-            self._results, self.description = [], []
-
-            if not payloads:
-                self.rowcount = 0
-                self._row_idx = 0
-                return
+            self._results, self._table = [], None
+            self._set_columns([])
+            self.rowcount = 0
+            self._row_idx = 0
 
             if isinstance(payloads, dict):
                 payloads = [payloads]
 
-            if all(isinstance(p, dict) for p in payloads):
-                cols = list(payloads[0].keys())
-                self._results = [tuple(p.get(c) for c in cols) for p in payloads]
-                self.description = [(col, None, None, None, None, None, None) for col in cols]
-            elif all(isinstance(p, (list, tuple)) for p in payloads):
-                self._results = [tuple(p) for p in payloads]
-                self.description = [(f"col{i}", None, None, None, None, None, None)
-                                    for i in range(len(self._results[0]))]
+            # single pass over the payloads, the first one decides the row shape
+            payloads = iter(payloads)
+            first = next(payloads, None)
+            if first is None:
+                return
+            rows = itertools.chain((first,), payloads)
+
+            if isinstance(first, dict):
+                # the same names come back on every query, keep one shared str per name
+                cols = [sys.intern(c) for c in first]
+                if len(cols) == 1:
+                    c0 = cols[0]
+                    self._results = [(p.get(c0),) for p in rows]
+                else:
+                    # itemgetter builds the row tuple in one C call; a row missing
+                    # a key falls back to None for it
+                    getter = operator.itemgetter(*cols)
+                    results = self._results
+                    append = results.append
+                    for p in rows:
+                        try:
+                            append(getter(p))
+                        except KeyError:
+                            append(tuple(p.get(c) for c in cols))
+                self._set_columns(cols)
+            elif isinstance(first, (list, tuple)):
+                self._results = [tuple(p) for p in rows]
+                self._set_columns([f"col{i}" for i in range(len(first))])
             else:
-                self._results = [(str(p),) for p in payloads]
-                self.description = [("col0", None, None, None, None, None, None)]
+                self._results = [(str(p),) for p in rows]
+                self._set_columns(["col0"])
 
             self.rowcount = len(self._results)
-            self._row_idx = 0
+
+        def _get_results(self):
+            if self._results is None:
+                self._results = list(zip(*(column.to_pylist() for column in self._table.columns)))
+            return self._results
+
+        def _release_fetched(self):
+            # all rows handed out: drop the buffers instead of holding them until close()
+            if self._row_idx >= self.rowcount:
+                self._results = []
+                if self._table is not None:
+                    self._table = self._table.schema.empty_table()
 
         def fetchone(self):
-            if self._row_idx < self.rowcount:
-                row = self._results[self._row_idx]
-                self._row_idx += 1
-                return row
+            idx = self._row_idx
+            if idx < self.rowcount:
+                results = self._results if self._results is not None else self._get_results()
+                self._row_idx = idx + 1
+                if idx + 1 == self.rowcount:
+                    self._release_fetched()
+                return results[idx]
             return None
 
         def fetchmany(self, size=1):
-            rows = self._results[self._row_idx:self._row_idx + size]
+            results = self._results if self._results is not None else self._get_results()
+            rows = results[self._row_idx:self._row_idx + size]
             self._row_idx += len(rows)
+            if self._row_idx >= self.rowcount:
+                self._release_fetched()
             return rows
 
         def fetchall(self):
-            rows = self._results[self._row_idx:]
+            results = self._get_results()
+            rows = results[self._row_idx:] if self._row_idx else results
             self._row_idx = self.rowcount
+            self._release_fetched()
             return rows
 
+        # remaining rows as a pyarrow.Table
+        def fetch_arrow(self):
+            if pyarrow is None:
+                raise DuckDBHTTPDBAPI.Error("fetch_arrow() requires pyarrow")
+            if self._table is not None:
+                table = self._table.slice(min(self._row_idx, self._table.num_rows))
+            else:
+                columns = list(zip(*self._results[self._row_idx:])) or [()] * len(self._cols)
+                table = pyarrow.Table.from_arrays([pyarrow.array(column) for column in columns], names=self._cols)
+            self._row_idx = self.rowcount
+            self._release_fetched()
+            return table
+
         def close(self):
             self._results = []
-            self.description = []
+            self._table = None
+            self._set_columns([])
             self.rowcount = 0
             self._row_idx = 0
 
@@ -133,7 +479,10 @@ class DuckDBHTTPDBAPI:
     def connect(username=None, password=None, host=None, port=None, **kw):                
         full_host = f"{username}:{password}@{host}" if username and password else host
         url = f"http://{full_host}:{port}/"        
-        return DuckDBHTTPDBAPI.Connection(url, kw.get("api_key"), (kw.get("read_only") or "").lower() == "true")
+        timeout = float(kw["timeout"]) if kw.get("timeout") else None
+        pool_size = int(kw["pool_size"]) if kw.get("pool_size") else _DEFAULT_POOL_SIZE
+        return DuckDBHTTPDBAPI.Connection(url, kw.get("api_key"), (kw.get("read_only") or "").lower() == "true", timeout,
+                                          kw.get("compression"), pool_size)
 
 
 # --- SQLAlchemy Dialect ---
@@ -209,26 +558,121 @@ class DuckDBHTTPDialect(default.DefaultDialect):
         "INT": sqltypes.Integer,
     }
 
+    # All type names in one case-insensitive alternation, longest first, so a single
+    # scan finds the leftmost and most specific name ("TIMESTAMPTZ" before "TIMESTAMP").
+    # Each name is its own group and m.lastindex picks the type, no string is built.
+    _type_keys = sorted(_type_map, key=len, reverse=True)
+    _type_re = re.compile("|".join(f"({re.escape(key)})" for key in _type_keys), re.IGNORECASE)
+    _type_values = list(map(_type_map.get, _type_keys))
+
+    # where create_engine(..., reflection_cache=True) keeps reflected schemas
+    _default_cache_dir = "~/.cache/duckdb_http"
+
+    def __init__(self, reflection_cache=None, **kw):
+        super().__init__(**kw)
+        self._disk_cache = None
+        if reflection_cache:
+            if diskcache is None:
+                raise ImportError("reflection_cache requires diskcache")
+            path = self._default_cache_dir if reflection_cache is True else reflection_cache
+            self._disk_cache = diskcache.Cache(os.path.expanduser(path))
+
     @classmethod
     def dbapi(cls):
         return DuckDBHTTPDBAPI
 
+    def clear_cache(self):
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    # type strings repeat across columns, so each distinct one is only scanned once
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _map_type(type_str):
-        type_str = type_str.upper()
-        for key, typ in DuckDBHTTPDialect._type_map.items():
-            if key in type_str:
-                return typ
-        return sqltypes.String
+        m = DuckDBHTTPDialect._type_re.search(type_str)
+        return DuckDBHTTPDialect._type_values[m.lastindex - 1] if m else sqltypes.String
 
     # -----------------------------
     # Schema / Table Reflection
     # -----------------------------
+    @cache # type: ignore[call-arg]
+    def _get_catalog_version(self, connection, **kw):
+        # changes whenever a table or view is created, altered or dropped
+        sql = text(
+            "SELECT md5(coalesce(string_agg(schema_name || '.' || coalesce(sql, ''), ';' "
+            "ORDER BY schema_name, sql), '')) AS version FROM ("
+            "SELECT schema_name, sql FROM duckdb_tables() "
+            "UNION ALL SELECT schema_name, sql FROM duckdb_views() WHERE NOT internal)"
+        )
+        return connection.execute(sql).scalar()
+
+    def _disk_cached(self, connection, name, schema, fetch, **kw):
+        # results survive restarts, keyed on the server, its catalog version and on
+        # this package, so an upgrade never serves types mapped by older code
+        if self._disk_cache is None:
+            return fetch()
+        url = connection.engine.url
+        key = (_REFLECTION_CACHE_FORMAT, _PACKAGE_VERSION, url.host, url.port, name, schema,
+               self._get_catalog_version(connection, **kw))
+        value = self._disk_cache.get(key)
+        if value is None:
+            value = fetch()
+            self._disk_cache.set(key, value)
+        return value
+
+    @cache # type: ignore[call-arg]
+    def _get_reflection_info(self, connection, schema=None, **kw):
+        return self._disk_cached(connection, "reflection_info", schema,
+                                 lambda: self._fetch_reflection_info(connection, schema), **kw)
+
+    def _fetch_reflection_info(self, connection, schema):
+        # columns, primary keys and kinds of every table in the schema of the current
+        # database (other attached catalogs, temp included, have schemas of the same
+        # name), all in one round trip
+        rows = connection.execute(text(
+            "SELECT c.table_name, c.column_name, c.data_type, c.is_nullable, c.column_default, t.table_type, k.pk "
+            "FROM information_schema.columns c JOIN information_schema.tables t "
+            "USING (table_catalog, table_schema, table_name) "
+            "LEFT JOIN (SELECT database_name AS table_catalog, schema_name AS table_schema, table_name, "
+            "constraint_column_names AS pk FROM duckdb_constraints() WHERE constraint_type = 'PRIMARY KEY') k "
+            "USING (table_catalog, table_schema, table_name) "
+            "WHERE c.table_catalog = current_database() "
+            "AND c.table_schema = coalesce(:schema, current_schema()) "
+            "ORDER BY c.table_name, c.ordinal_position"
+        ), {"schema": schema})
+
+        tables, pks, kinds = {}, {}, {}
+        for table_name, column_name, data_type, is_nullable, column_default, table_type, pk in rows:
+            tables.setdefault(table_name, []).append({
+                "name": column_name,
+                "type": self._map_type(data_type),
+                "nullable": is_nullable == "YES",
+                "default": column_default,   # SQL expression string
+                "autoincrement": False,
+            })
+            kinds[table_name] = table_type   # "BASE TABLE" or "VIEW"
+            if pk:
+                pks[table_name] = list(pk)
+        return tables, pks, kinds
+
+    def _get_all_columns(self, connection, schema=None, **kw):
+        return self._get_reflection_info(connection, schema, **kw)[0]
+
+    def _get_all_pk(self, connection, schema=None, **kw):
+        return self._get_reflection_info(connection, schema, **kw)[1]
+
+    @staticmethod
+    def _resolve_name(names, name):
+        # DuckDB identifiers are case-insensitive: Table("mixed") is the table Mixed
+        if name in names:
+            return name
+        folded = name.lower()
+        return next((n for n in names if n.lower() == folded), None)
+
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
-        full_table = f"{schema}.{table_name}" if schema else table_name
-        sql = text(f"PRAGMA table_info('{full_table}')")
-        result = connection.execute(sql)
-        pk_columns = [row[1] for row in result if row[5] == "true"]
+        tables = self._get_all_columns(connection, schema, **kw)
+        name = self._resolve_name(tables, table_name)
+        pk_columns = self._get_all_pk(connection, schema, **kw).get(name, [])
         return {"constrained_columns": pk_columns, "name": None}
 
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
@@ -240,9 +684,41 @@ class DuckDBHTTPDialect(default.DefaultDialect):
     def get_multi_indexes(self, connection, schema=None, filter_names=None, **kw):
         return []
 
+    def _filter_tables(self, connection, schema, filter_names, kind=None, scope=None, **kw):
+        # kind / scope are the ObjectKind / ObjectScope flags of the 2.0 Inspector
+        tables, _, kinds = self._get_reflection_info(connection, schema, **kw)
+        if scope is not None and not scope & ObjectScope.DEFAULT:
+            # temporary objects live in the temp catalog, which is not reflected
+            return {}
+        # requested name -> name in the catalog, results are keyed by what was asked for
+        if filter_names is None:
+            names = {name: name for name in tables}
+        else:
+            names = {name: self._resolve_name(tables, name) for name in filter_names}
+            names = {name: found for name, found in names.items() if found is not None}
+        if kind is not None:
+            wanted = set()
+            if kind & ObjectKind.TABLE:
+                wanted.add("BASE TABLE")
+            if kind & ObjectKind.VIEW:
+                wanted.add("VIEW")
+            names = {name: found for name, found in names.items() if kinds[found] in wanted}
+        return {name: (found, tables[found]) for name, found in names.items()}
+
+    def get_multi_columns(self, connection, schema=None, filter_names=None, kind=None, scope=None, **kw):
+        tables = self._filter_tables(connection, schema, filter_names, kind, scope, **kw)
+        return [((schema, name), columns) for name, (_, columns) in tables.items()]
+
+    def get_multi_pk_constraint(self, connection, schema=None, filter_names=None, kind=None, scope=None, **kw):
+        tables = self._filter_tables(connection, schema, filter_names, kind, scope, **kw)
+        pks = self._get_all_pk(connection, schema, **kw)
+        return [((schema, name), {"constrained_columns": pks.get(found, []), "name": None})
+                for name, (found, _) in tables.items()]
+
     def get_view_names(self, connection, schema=None, **kw):
-        sql = text(f"SELECT table_name FROM information_schema.tables WHERE table_type='VIEW' AND table_schema = '{schema}'")
-        result = connection.execute(sql)
+        sql = text("SELECT table_name FROM information_schema.tables "
+                   "WHERE table_type='VIEW' AND table_schema = coalesce(:schema, current_schema())")
+        result = connection.execute(sql, {"schema": schema})
         return [row.table_name for row in result]
 
     @cache # type: ignore[call-arg]
@@ -253,34 +729,16 @@ class DuckDBHTTPDialect(default.DefaultDialect):
 
     @cache # type: ignore[call-arg]
     def get_table_names(self, connection, schema=None, **kw):
-        where =  f" WHERE schema_name='{schema}'" if schema else ""
-        sql = text(f"SELECT table_name FROM duckdb_tables(){where}")
-        result = connection.execute(sql)
+        return self._disk_cached(connection, "table_names", schema,
+                                 lambda: self._fetch_table_names(connection, schema), **kw)
+
+    def _fetch_table_names(self, connection, schema):
+        sql = text("SELECT table_name FROM duckdb_tables() WHERE :schema IS NULL OR schema_name = :schema")
+        result = connection.execute(sql, {"schema": schema})
         return [row.table_name for row in result]
 
     def get_columns(self, connection, table_name, schema=None, **kw):
-        # Fully qualified table name
-        full_table = f"{schema}.{table_name}" if schema else table_name
-
-        # Use PRAGMA table_info instead of DESCRIBE
-        sql = text(f"PRAGMA table_info('{full_table}')")
-        result = connection.execute(sql)
-
-        columns = []
-        for row in result:
-            colname = row[1]          # "name"
-            coltype = self._map_type(row[2])  # "type"
-            notnull = row[3]          # 1 = NOT NULL, 0 = NULLABLE
-            default = row[4]          # default value (as SQL expression string)
-            pk = row[5]               # >0 if part of primary key
-
-            columns.append({
-                "name": colname,
-                "type": coltype,
-                "nullable": not notnull,
-                "default": default,
-                "autoincrement": bool(pk and coltype.__class__.__name__ == "INTEGER"),
-            })
-        return columns
+        tables = self._get_all_columns(connection, schema, **kw)
+        return tables.get(self._resolve_name(tables, table_name), [])
 
 __all__ = ["DuckDBHTTPDialect"]
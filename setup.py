@@ -9,5 +9,7 @@ setup(
             "duckdb_http = duckdb_http:DuckDBHTTPDialect",
         ],
     },
-    install_requires=["duckdb==1.3.2", "sqlalchemy==1.4.54", "requests", "sqlglot==27.6.0"],
+    extras_require={"fast": ["orjson"], "arrow": ["pyarrow"], "zstd": ["zstandard"],
+                    "cache": ["diskcache"], "test": ["pytest"]},
+    install_requires=["duckdb==1.3.2", "sqlalchemy==1.4.54", "requests", "ijson>=3.1", "sqlglot==27.6.0"],
 )
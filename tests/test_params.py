@@ -0,0 +1,110 @@
+import decimal
+import json
+
+from duckdb_http import DuckDBHTTPDBAPI, _NO_SERVER_BINDING, _render_literal, _render_placeholder, _substitute
+
+
+def inline(query, parameters):
+    return _substitute(query, parameters, _render_literal)
+
+
+def test_named_parameters():
+    assert inline("SELECT %(a)s, %(b)s, %(a)s", {"a": 1, "b": "x"}) == "SELECT 1, 'x', 1"
+
+
+def test_positional_parameters():
+    assert inline("SELECT %s, %s", (1, "x")) == "SELECT 1, 'x'"
+    assert inline("SELECT %s", [None]) == "SELECT NULL"
+
+
+def test_quotes_are_escaped():
+    assert inline("SELECT %(s)s", {"s": "it's"}) == "SELECT 'it''s'"
+    assert inline("SELECT %(s)s", {"s": "'; DROP TABLE t; --"}) == "SELECT '''; DROP TABLE t; --'"
+
+
+def test_escaped_percent():
+    assert inline("SELECT 'a%%' LIKE %(p)s", {"p": "a%"}) == "SELECT 'a%' LIKE 'a%'"
+    assert inline("SELECT 'a%%'", {}) == "SELECT 'a%'"
+
+
+def test_none_and_bool():
+    assert inline("SELECT %s, %s, %s", (None, True, False)) == "SELECT NULL, TRUE, FALSE"
+
+
+def test_bytes():
+    assert inline("SELECT %s", (b"\x00\xff",)) == "SELECT '\\x00\\xff'::BLOB"
+
+
+def test_numbers():
+    assert inline("SELECT %s, %s", (1.5, decimal.Decimal("18.25"))) == "SELECT 1.5, 18.25"
+
+
+def test_negative_numbers_cannot_start_a_comment():
+    assert inline("SELECT 5 -%s", (-1,)) == "SELECT 5 - -1"
+    assert inline("SELECT 5 -%s, 5 -%s", (-1.5, decimal.Decimal("-2"))) == "SELECT 5 - -1.5, 5 - -2"
+
+
+def test_huge_ints():
+    assert inline("SELECT %s", (2**70,)) == f"SELECT {2**70}"
+
+
+def test_non_finite_floats():
+    assert inline("SELECT %s, %s", (float("nan"), float("-inf"))) == "SELECT 'nan'::DOUBLE, '-inf'::DOUBLE"
+    assert inline("SELECT %s", (decimal.Decimal("Infinity"),)) == "SELECT 'Infinity'::DOUBLE"
+
+
+def test_placeholders():
+    assert _substitute("SELECT %(a)s, '%%'", {"a": 1}, _render_placeholder) == "SELECT $a, '%'"
+    assert _substitute("SELECT %s, %s", (1, 2), _render_placeholder) == "SELECT ?, ?"
+
+
+class _Response:
+    status_code = 200
+    headers = {"Content-Type": "application/x-ndjson"}
+    text = ""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def iter_lines(self, chunk_size=None, decode_unicode=False):
+        return iter([b'{"x": 1}'])
+
+
+class _Session:
+    def __init__(self):
+        self.bodies = []
+
+    def post(self, url, data, headers, **kw):
+        self.bodies.append((data, headers.get("Content-Type")))
+        return _Response()
+
+
+def _execute(query, parameters):
+    _NO_SERVER_BINDING.discard("http://test/")
+    session = _Session()
+    DuckDBHTTPDBAPI.Cursor("http://test/", session=session).execute(query, parameters)
+    return session.bodies
+
+
+def test_plain_values_are_bound():
+    [(body, content_type)] = _execute("SELECT %(a)s, %(n)s", {"a": "x", "n": None})
+    assert content_type == "application/json"
+    assert json.loads(body) == {"sql": "SELECT $a, $n", "params": {"a": "x", "n": None}}
+
+
+def test_non_json_values_are_inlined():
+    assert _execute("SELECT %(b)s", {"b": b"\x00"}) == [(b"SELECT '\\x00'::BLOB", None)]
+    assert _execute("SELECT %(d)s", {"d": decimal.Decimal("1.5")}) == [(b"SELECT 1.5", None)]
+    assert _execute("SELECT %(f)s", {"f": float("nan")}) == [(b"SELECT 'nan'::DOUBLE", None)]
+    assert _execute("SELECT cast(%(x)s AS HUGEINT)", {"x": 2**70}) == [(f"SELECT cast({2**70} AS HUGEINT)".encode(), None)]
+    assert _execute("SELECT %(x)s", {"x": -2**63 - 1}) == [(f"SELECT  {-2**63 - 1}".encode(), None)]
+
+
+def test_64_bit_ints_are_bound():
+    for value in (-2**63, 2**64 - 1):
+        [(body, content_type)] = _execute("SELECT %(x)s", {"x": value})
+        assert content_type == "application/json"
+        assert json.loads(body)["params"] == {"x": value}
@@ -0,0 +1,38 @@
+import gc
+
+import pytest
+
+import duckdb_http
+from duckdb_http import DuckDBHTTPDBAPI
+
+
+def test_pool_is_bounded(monkeypatch):
+    monkeypatch.setattr(duckdb_http, "_POOL_TIMEOUT", 0.01)
+    conn = DuckDBHTTPDBAPI.Connection("http://pool-bounded/", pool_size=1)
+    with pytest.raises(DuckDBHTTPDBAPI.Error, match="No free session"):
+        DuckDBHTTPDBAPI.Connection("http://pool-bounded/", pool_size=1)
+    session = conn._session
+    conn.close()
+    assert DuckDBHTTPDBAPI.Connection("http://pool-bounded/", pool_size=1)._session is session
+
+
+def test_collected_connection_returns_its_session(monkeypatch):
+    monkeypatch.setattr(duckdb_http, "_POOL_TIMEOUT", 0.01)
+    conn = DuckDBHTTPDBAPI.Connection("http://pool-gc/", pool_size=1)
+    session = conn._session
+    del conn
+    gc.collect()
+    assert DuckDBHTTPDBAPI.Connection("http://pool-gc/", pool_size=1)._session is session
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(DuckDBHTTPDBAPI.Error, match="pool_size"):
+        DuckDBHTTPDBAPI.Connection("http://pool-zero/", pool_size=0)
+
+
+def test_cursor_of_closed_connection():
+    conn = DuckDBHTTPDBAPI.Connection("http://pool-closed/")
+    cursor = conn.cursor()
+    conn.close()
+    with pytest.raises(DuckDBHTTPDBAPI.Error, match="closed"):
+        cursor.execute("SELECT 1")
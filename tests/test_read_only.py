@@ -0,0 +1,26 @@
+from duckdb_http import _parse_read_only, is_read_only
+
+QUERIES = [
+    "SELECT 1",
+    "select * from t where a = 1",
+    "SELECT 1;",
+    "SELECT 1; DROP TABLE t",
+    "SHOW TABLES",
+    "EXPLAIN SELECT 1",
+    "PRAGMA table_info('t')",
+    "PRAGMA threads=1",
+    "PRAGMA create_fts_index('t', 'id', 'body')",
+    "WITH x AS (SELECT 1) SELECT * FROM x",
+    "WITH x AS (SELECT 1) DELETE FROM t",
+    "DELETE FROM t",
+]
+
+
+def test_fast_path_agrees_with_parser():
+    for query in QUERIES:
+        assert is_read_only(query) == _parse_read_only.__wrapped__(query.strip()), query
+
+
+def test_pragma_is_blocked():
+    assert not is_read_only("PRAGMA threads=1")
+    assert not is_read_only("PRAGMA drop_fts_index('t')")
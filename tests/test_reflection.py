@@ -0,0 +1,32 @@
+from sqlalchemy import types as sqltypes
+
+from duckdb_http import DuckDBHTTPDialect
+
+COLUMNS = [{"name": "id", "type": sqltypes.Integer, "nullable": False, "default": None, "autoincrement": False}]
+
+
+def dialect(monkeypatch):
+    info = ({"Mixed": COLUMNS, "v": COLUMNS}, {"Mixed": ["id"]}, {"Mixed": "BASE TABLE", "v": "VIEW"})
+    d = DuckDBHTTPDialect()
+    monkeypatch.setattr(d, "_fetch_reflection_info", lambda connection, schema: info)
+    return d
+
+
+def test_exact_name(monkeypatch):
+    d = dialect(monkeypatch)
+    assert d.get_columns(None, "Mixed") == COLUMNS
+    assert d.get_pk_constraint(None, "Mixed")["constrained_columns"] == ["id"]
+
+
+def test_names_are_case_insensitive(monkeypatch):
+    d = dialect(monkeypatch)
+    assert d.get_columns(None, "mixed") == COLUMNS
+    assert d.get_pk_constraint(None, "MIXED")["constrained_columns"] == ["id"]
+    assert d.get_columns(None, "missing") == []
+
+
+def test_multi_results_keyed_by_requested_name(monkeypatch):
+    d = dialect(monkeypatch)
+    assert d.get_multi_columns(None, filter_names=["mixed", "missing"]) == [((None, "mixed"), COLUMNS)]
+    assert d.get_multi_pk_constraint(None, filter_names=["MIXED"]) == [
+        ((None, "MIXED"), {"constrained_columns": ["id"], "name": None})]
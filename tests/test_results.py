@@ -0,0 +1,55 @@
+import io
+
+import pytest
+
+from duckdb_http import DuckDBHTTPDBAPI
+
+
+def rows(payloads):
+    cursor = DuckDBHTTPDBAPI.Cursor("http://localhost:9999/")
+    cursor._process_payloads(payloads)
+    return cursor
+
+
+def test_object_rows():
+    cursor = rows([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+    assert [d[0] for d in cursor.description] == ["a", "b"]
+    assert cursor.fetchall() == [(1, "x"), (2, "y")]
+
+
+def test_object_rows_with_missing_keys():
+    assert rows([{"a": 1, "b": 2}, {"a": 3}, {"b": 4}]).fetchall() == [(1, 2), (3, None), (None, 4)]
+    assert rows([{"a": 1}, {"b": 2}]).fetchall() == [(1,), (None,)]
+
+
+def test_array_rows():
+    cursor = rows([[1, "x"], [2, "y"]])
+    assert [d[0] for d in cursor.description] == ["col0", "col1"]
+    assert cursor.fetchone() == (1, "x")
+    assert cursor.fetchmany(5) == [(2, "y")]
+    assert cursor.fetchone() is None
+
+
+class _Raw(io.BytesIO):
+    decode_content = False
+
+
+class _Response:
+    headers = {"Content-Type": "application/json"}
+
+    def __init__(self, body):
+        self.raw = _Raw(body)
+
+
+def json_rows(body):
+    return rows(DuckDBHTTPDBAPI.Cursor._iter_payloads(_Response(body)))
+
+
+def test_json_array_body():
+    assert json_rows(b'[{"a": 1.5}, {"a": 2}]').fetchall() == [(1.5,), (2,)]
+    assert json_rows(b"[]").fetchall() == []
+
+
+def test_json_object_body_is_an_error():
+    with pytest.raises(DuckDBHTTPDBAPI.Error, match="start_map"):
+        json_rows(b'{"meta": [], "data": [[1], [2]], "rows": 2}')